@@ -6,7 +6,6 @@ import io
 import os
 from typing import IO, Any, Dict, Optional, Union
 
-from .io import compress_and_pickle, uncompress_and_unpickle
 from .picklers import get_pickler
 from .utils import instantiate_compresser
 
@@ -38,7 +37,7 @@ def dump(
     Behind the scenes, this function only instantiates
     :class:`~compress_pickle.compressers.base.BaseCompresser` and
     :class:`~compress_pickle.picklers.base.BasePicklerIO` instances depending on the supplied
-    names, and then calls :func:`~compress_pickle.io.base.compress_and_pickle` with them.
+    names, and then calls :meth:`~compress_pickle.compressers.base.BaseCompresser.dump` with them.
 
     Parameters
     ----------
@@ -103,12 +102,7 @@ def dump(
     if pickler_kwargs is None:
         pickler_kwargs = {}
     try:
-        compress_and_pickle(
-            compresser,
-            pickler=pickler,
-            obj=obj,
-            **pickler_kwargs,
-        )
+        compresser.dump(pickler, obj, **pickler_kwargs)
     finally:
         compresser.close()
 
@@ -129,7 +123,7 @@ def dumps(
     Behind the scenes, this function only instantiates
     :class:`~compress_pickle.compressers.base.BaseCompresser` around a ``io.BinaryIO`` and
     :class:`~compress_pickle.picklers.base.BasePicklerIO` instances depending on the supplied
-    names, and then calls :func:`~compress_pickle.io.base.compress_and_pickle` with them. The
+    names, and then calls :meth:`~compress_pickle.compressers.base.BaseCompresser.dump` with them. The
     contents of the ``io.BinaryIO`` are then returned.
 
     Parameters
@@ -201,7 +195,7 @@ def load(
     Behind the scenes, this function only instantiates
     :class:`~compress_pickle.compressers.base.BaseCompresser` and
     :class:`~compress_pickle.picklers.base.BasePicklerIO` instances depending on the supplied
-    names, and then calls :func:`~compress_pickle.io.base.uncompress_and_unpickle` with them.
+    names, and then calls :meth:`~compress_pickle.compressers.base.BaseCompresser.load` with them.
 
     Parameters
     ----------
@@ -269,11 +263,7 @@ def load(
     if pickler_kwargs is None:
         pickler_kwargs = {}
     try:
-        output = uncompress_and_unpickle(
-            compresser,
-            pickler=pickler,
-            **pickler_kwargs,
-        )
+        output = compresser.load(pickler, **pickler_kwargs)
     finally:
         compresser.close()
     return output
@@ -295,7 +285,7 @@ def loads(
     Behind the scenes, this function only instantiates
     :class:`~compress_pickle.compressers.base.BaseCompresser` around a ``io.BinaryIO(data)`` stream
     and :class:`~compress_pickle.picklers.base.BasePicklerIO` instances depending on the supplied
-    names, and then calls :func:`~compress_pickle.io.base.uncompress_and_unpickle` with them.
+    names, and then calls :meth:`~compress_pickle.compressers.base.BaseCompresser.load` with them.
 
     Parameters
     ----------
@@ -340,7 +330,7 @@ def loads(
     -----
     The ``compression`` argument is mandatory because it cannot be inferred.
     """
-    with io.BytesIO(bytes(data)) as stream:
+    with io.BytesIO(data) as stream:
         return load(
             stream,
             compression=compression,
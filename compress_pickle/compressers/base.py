@@ -1,10 +1,44 @@
 from abc import abstractmethod
+from io import BufferedWriter, IOBase
 from os import PathLike
-from typing import IO, Union
+from typing import IO, TYPE_CHECKING, Any, Optional, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..picklers.base import BasePicklerIO
 
 PATH_TYPES = (str, bytes, PathLike)
+PATH_OR_STREAM_TYPES = PATH_TYPES + (IOBase,)
 PathType = Union[str, bytes, PathLike]
 
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _buffered_writer(
+    stream: IO[bytes], mode: str, buffer_size: Optional[int] = _WRITE_BUFFER_SIZE
+) -> IO[bytes]:
+    """Wrap a compression stream that is opened for writing in an ``io.BufferedWriter``.
+
+    The picklers emit many small writes, and every write that reaches a compression stream is
+    run through the compressor separately, so they are batched into ``buffer_size`` blocks.
+
+    Parameters
+    ----------
+    stream : IO[bytes]
+        The compression stream.
+    mode : str
+        The mode with which ``stream`` was opened. Streams opened for reading are returned as is.
+    buffer_size : Optional[int]
+        The size of the write buffer. If ``None``, ``stream`` is returned as is.
+
+    Returns
+    -------
+    IO[bytes]
+        The buffered stream. Closing it flushes the buffer and closes ``stream``.
+    """
+    if buffer_size is None or "r" in mode:
+        return stream
+    return BufferedWriter(stream, buffer_size=buffer_size)  # type: ignore
+
 
 class BaseCompresser:
     """Compresser abstract base class.
@@ -59,3 +93,36 @@ class BaseCompresser:
             The input/output binary stream where the pickled objects are written to or read from.
         """
         pass
+
+    def dump(self, pickler: "BasePicklerIO", obj: Any, **kwargs):
+        """Serialize an object and write it to the compresser's stream.
+
+        Parameters
+        ----------
+        pickler : BasePicklerIO
+            The object that is responsible for serializing the ``obj`` and writting its binary
+            representation into the file-like stream provided by :meth:`get_stream`.
+        obj : Any
+            The object that you wish to serialize, compress and write.
+        **kwargs
+            Any extra keyword arguments are passed to the pickler's ``dump`` method.
+        """
+        pickler.dump(obj=obj, stream=self.get_stream(), **kwargs)
+
+    def load(self, pickler: "BasePicklerIO", **kwargs) -> Any:
+        """Load and uncompress an object from the compresser's stream.
+
+        Parameters
+        ----------
+        pickler : BasePicklerIO
+            The object that is responsible for reading the contents of the file-like stream
+            provided by :meth:`get_stream` and loading the serialized object.
+        **kwargs
+            Any extra keyword arguments are passed to the pickler's ``load`` method.
+
+        Returns
+        -------
+        Any
+            The resulting uncompressed and unserialized object.
+        """
+        return pickler.load(stream=self.get_stream(), **kwargs)
@@ -1,10 +1,25 @@
 import bz2
-from io import IOBase
-from typing import IO, Union
+import os
+from importlib.util import find_spec
+from typing import IO, Optional, Union
 
-from .base import PATH_TYPES, BaseCompresser, PathType
+from .base import (
+    _WRITE_BUFFER_SIZE,
+    PATH_OR_STREAM_TYPES,
+    PATH_TYPES,
+    BaseCompresser,
+    PathType,
+    _buffered_writer,
+)
 from .registry import register_compresser
 
+# indexed_bzip2 is only imported the first time that a file is read in parallel, so that importing
+# compress_pickle does not pay for its import time.
+_indexed_bzip2_available = find_spec("indexed_bzip2") is not None
+
+
+_DEFAULT_COMPRESSLEVEL = 6
+
 
 class Bz2Compresser(BaseCompresser):
     """Compresser class that wraps the bz2 compression package.
@@ -12,6 +27,9 @@ class Bz2Compresser(BaseCompresser):
     This class relies on the :mod:`bz2` module to open the input/output binary stream where the
     pickled python objects will be written to (or read from). During an instance's initialization,
     the binary stream is opened using ``bz2.open(path, mode=mode, **kwargs)``.
+    If the optional `indexed_bzip2 <https://pypi.org/project/indexed-bzip2/>`_ package is
+    installed, files that are opened for reading from a path are decompressed in parallel using
+    ``indexed_bzip2.open(path, parallelization=os.cpu_count())`` instead.
 
     Parameters
     ----------
@@ -21,14 +39,47 @@ class Bz2Compresser(BaseCompresser):
         input/output binary stream.
     mode : str
         Mode with which to open the file buffer.
+    parallel : bool
+        If ``True`` (default) and ``indexed_bzip2`` is installed, files that are opened for
+        reading are decompressed in parallel. This has no effect when writing.
+    buffer_size : Optional[int]
+        Size of the ``io.BufferedWriter`` that batches the pickler's writes before they reach the
+        compressor. Only used when writing. If ``None``, writes are not buffered.
     kwargs
-        Any other key word arguments that are passed to :func:`bz2.open`.
+        Any other key word arguments that are passed to :func:`bz2.open`. When writing,
+        ``compresslevel`` defaults to 6 (600k blocks) instead of :mod:`bz2`'s 9, which lowers
+        the compressor's memory use.
     """
 
-    def __init__(self, path: Union[PathType, IO[bytes]], mode: str, **kwargs):
-        if not isinstance(path, PATH_TYPES + (IOBase,)):
+    def __init__(
+        self,
+        path: Union[PathType, IO[bytes]],
+        mode: str,
+        *,
+        parallel: bool = True,
+        buffer_size: Optional[int] = _WRITE_BUFFER_SIZE,
+        **kwargs,
+    ):
+        if not isinstance(path, PATH_OR_STREAM_TYPES):
             raise TypeError(f"Unhandled path type {type(path)}")
-        self._stream = bz2.open(path, mode=mode, **kwargs)  # type: ignore
+        if (
+            parallel
+            and _indexed_bzip2_available
+            and "r" in mode
+            and not kwargs
+            and isinstance(path, PATH_TYPES)
+        ):
+            import indexed_bzip2
+
+            self._stream = indexed_bzip2.open(
+                os.fsdecode(path), parallelization=os.cpu_count() or 1
+            )
+        else:
+            if "r" not in mode:
+                kwargs.setdefault("compresslevel", _DEFAULT_COMPRESSLEVEL)
+            self._stream = _buffered_writer(
+                bz2.open(path, mode=mode, **kwargs), mode, buffer_size  # type: ignore
+            )
 
     def close(self):
         self._stream.close()
@@ -1,17 +1,36 @@
 import gzip
-from io import IOBase
-from typing import IO, Union
+import os
+from importlib.util import find_spec
+from typing import IO, Optional, Union
 
-from .base import PATH_TYPES, BaseCompresser, PathType
+from .base import (
+    _WRITE_BUFFER_SIZE,
+    PATH_OR_STREAM_TYPES,
+    PATH_TYPES,
+    BaseCompresser,
+    PathType,
+    _buffered_writer,
+)
 from .registry import register_compresser
 
+# rapidgzip is only imported the first time that a file is read in parallel, so that importing
+# compress_pickle does not pay for its import time.
+_rapidgzip_available = find_spec("rapidgzip") is not None
+
+
+_DEFAULT_COMPRESSLEVEL = 6
+
 
 class GzipCompresser(BaseCompresser):
     """Compresser class that wraps the gzip compression package.
 
     This class relies on the :mod:`gzip` module to open the input/output binary stream where the
     pickled python objects will be written to (or read from). During an instance's initialization,
-    the binary stream is opened using ``gzip.open(path, mode=mode, **kwargs)``.
+    the binary stream is opened using ``gzip.GzipFile(path, mode=mode, **kwargs)`` (or with
+    ``fileobj=path`` if ``path`` is a file-like object).
+    If the optional `rapidgzip <https://pypi.org/project/rapidgzip/>`_ package is installed, files
+    that are opened for reading from a path are decompressed in parallel using
+    ``rapidgzip.open(path, parallelization=os.cpu_count())`` instead.
 
     Parameters
     ----------
@@ -21,14 +40,50 @@ class GzipCompresser(BaseCompresser):
         input/output binary stream.
     mode : str
         Mode with which to open the file buffer.
+    parallel : bool
+        If ``True`` (default) and ``rapidgzip`` is installed, files that are opened for reading
+        are decompressed in parallel. This has no effect when writing.
+    buffer_size : Optional[int]
+        Size of the ``io.BufferedWriter`` that batches the pickler's writes before they reach the
+        compressor. Only used when writing. If ``None``, writes are not buffered.
     kwargs
-        Any other key word arguments that are passed to :func:`gzip.open`.
+        Any other key word arguments that are passed to :class:`gzip.GzipFile`. For example,
+        ``mtime=0`` to get reproducible output. When writing, ``compresslevel`` defaults to 6
+        instead of :mod:`gzip`'s 9, which is considerably faster and compresses pickles almost
+        as well.
     """
 
-    def __init__(self, path: Union[PathType, IO[bytes]], mode: str, **kwargs):
-        if not isinstance(path, PATH_TYPES + (IOBase,)):
+    def __init__(
+        self,
+        path: Union[PathType, IO[bytes]],
+        mode: str,
+        *,
+        parallel: bool = True,
+        buffer_size: Optional[int] = _WRITE_BUFFER_SIZE,
+        **kwargs,
+    ):
+        if not isinstance(path, PATH_OR_STREAM_TYPES):
             raise TypeError(f"Unhandled path type {type(path)}")
-        self._stream = gzip.open(path, mode=mode, **kwargs)
+        if (
+            parallel
+            and _rapidgzip_available
+            and "r" in mode
+            and not kwargs
+            and isinstance(path, PATH_TYPES)
+        ):
+            import rapidgzip
+
+            self._stream = rapidgzip.open(
+                os.fsdecode(path), parallelization=os.cpu_count() or 1
+            )
+        else:
+            if "r" not in mode:
+                kwargs.setdefault("compresslevel", _DEFAULT_COMPRESSLEVEL)
+            if isinstance(path, PATH_TYPES):
+                stream = gzip.GzipFile(path, mode=mode, **kwargs)
+            else:
+                stream = gzip.GzipFile(fileobj=path, mode=mode, **kwargs)
+            self._stream = _buffered_writer(stream, mode, buffer_size)
 
     def close(self):
         self._stream.close()
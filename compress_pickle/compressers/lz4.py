@@ -1,7 +1,12 @@
-from io import IOBase
-from typing import IO, Union
+from typing import IO, Optional, Union
 
-from .base import PATH_TYPES, BaseCompresser, PathType
+from .base import (
+    _WRITE_BUFFER_SIZE,
+    PATH_OR_STREAM_TYPES,
+    BaseCompresser,
+    PathType,
+    _buffered_writer,
+)
 from .registry import register_compresser
 
 try:
@@ -27,19 +32,31 @@ class Lz4Compresser(BaseCompresser):
         input/output binary stream.
     mode : str
         Mode with which to open the file buffer.
+    buffer_size : Optional[int]
+        Size of the ``io.BufferedWriter`` that batches the pickler's writes before they reach the
+        compressor. Only used when writing. If ``None``, writes are not buffered.
     kwargs
         Any other key word arguments that are passed to :func:`lz4.frame.open`.
     """
 
-    def __init__(self, path: Union[PathType, IO[bytes]], mode: str, **kwargs):
+    def __init__(
+        self,
+        path: Union[PathType, IO[bytes]],
+        mode: str,
+        *,
+        buffer_size: Optional[int] = _WRITE_BUFFER_SIZE,
+        **kwargs,
+    ):
         if not _lz4_available:
             raise RuntimeError(
                 "The lz4 compression protocol requires the lz4 package to be installed. "
                 "Please pip install lz4 and retry."
             )
-        if not isinstance(path, PATH_TYPES + (IOBase,)):
+        if not isinstance(path, PATH_OR_STREAM_TYPES):
             raise TypeError(f"Unhandled path type {type(path)}")
-        self._stream = lz4.frame.open(path, mode=mode, **kwargs)
+        self._stream = _buffered_writer(
+            lz4.frame.open(path, mode=mode, **kwargs), mode, buffer_size
+        )
 
     def close(self):
         self._stream.close()
@@ -1,8 +1,13 @@
 import lzma
-from io import IOBase
-from typing import IO, Union
-
-from .base import PATH_TYPES, BaseCompresser, PathType
+from typing import IO, Optional, Union
+
+from .base import (
+    _WRITE_BUFFER_SIZE,
+    PATH_OR_STREAM_TYPES,
+    BaseCompresser,
+    PathType,
+    _buffered_writer,
+)
 from .registry import register_compresser
 
 
@@ -21,14 +26,26 @@ class LzmaCompresser(BaseCompresser):
         input/output binary stream.
     mode : str
         Mode with which to open the file buffer.
+    buffer_size : Optional[int]
+        Size of the ``io.BufferedWriter`` that batches the pickler's writes before they reach the
+        compressor. Only used when writing. If ``None``, writes are not buffered.
     kwargs
         Any other key word arguments that are passed to :func:`lzma.open`.
     """
 
-    def __init__(self, path: Union[PathType, IO[bytes]], mode: str, **kwargs):
-        if not isinstance(path, PATH_TYPES + (IOBase,)):
+    def __init__(
+        self,
+        path: Union[PathType, IO[bytes]],
+        mode: str,
+        *,
+        buffer_size: Optional[int] = _WRITE_BUFFER_SIZE,
+        **kwargs,
+    ):
+        if not isinstance(path, PATH_OR_STREAM_TYPES):
             raise TypeError(f"Unhandled path type {type(path)}")
-        self._stream = lzma.open(path, mode=mode, **kwargs)
+        self._stream = _buffered_writer(
+            lzma.open(path, mode=mode, **kwargs), mode, buffer_size
+        )
 
     def close(self):
         self._stream.close()
@@ -20,7 +20,9 @@ class NoCompresser(BaseCompresser):
     mode : str
         Mode with which to open the file buffer.
     kwargs
-        Any other key word arguments that are passed to :func:`open`.
+        Any other key word arguments that are passed to :func:`open`. Avoid passing
+        ``buffering=0``: the resulting raw :class:`io.FileIO` may perform partial writes, which
+        the picklers do not retry, so large objects could be silently truncated.
     """
 
     def __init__(self, path: Union[PathType, IO[bytes]], mode: str, **kwargs):
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Sequence, Type
+from typing import Dict, List, NamedTuple, Optional, Sequence, Type
 
 from .base import BaseCompresser
 
@@ -17,17 +17,47 @@ __all__ = [
     "list_registered_compressers",
 ]
 
+_MISSING = object()
 
-class _compresser_registry:
-    _compresser_registry: Dict[Optional[str], Type[BaseCompresser]] = {}
 
-    _compresser_default_write_modes: Dict[Optional[str], str] = {}
+def _lookup(mapping: dict, key):
+    """Get ``mapping[key]`` or the ``_MISSING`` sentinel if ``key`` is not in ``mapping``.
+
+    Unhashable keys can never be registered, so they are also reported as missing.
+    """
+    try:
+        return mapping.get(key, _MISSING)
+    except TypeError:
+        return _MISSING
 
-    _compresser_default_read_modes: Dict[Optional[str], str] = {}
 
-    _compression_extension_map: Dict[str, Optional[str]] = {}
+def _normalize_extension(extension: str) -> str:
+    """Remove a single leading dot from ``extension`` and lowercase it."""
+    return (extension[1:] if extension.startswith(".") else extension).lower()
+
+
+def _unknown_compression_error(compression) -> ValueError:
+    """Build the error raised when ``compression`` is not in the registry."""
+    return ValueError(
+        f"Unknown compression {repr(compression)}. "
+        f"Available values are: {list(_compresser_registry._compression_info)}"
+    )
+
 
-    _compression_aliases: Dict[str, Optional[str]] = {}
+class _CompressionInfo(NamedTuple):
+    """Everything that is registered for a single compression name (or alias)."""
+
+    compresser: Type[BaseCompresser]
+    default_write_mode: str
+    default_read_mode: str
+    default_extension: Optional[str]
+    alias_of: Optional[str] = None
+
+
+class _compresser_registry:
+    _compression_info: Dict[Optional[str], _CompressionInfo] = {}
+
+    _compression_extension_map: Dict[str, Optional[str]] = {}
 
     @classmethod
     def get_compresser(cls, compression: Optional[str]) -> Type[BaseCompresser]:
@@ -48,13 +78,13 @@ class _compresser_registry:
         Type[BaseCompresser]
             The compresser class associated to the ``compression`` name.
         """
-        try:
-            return cls._compresser_registry[compression]
-        except Exception:
+        info = _lookup(cls._compression_info, compression)
+        if info is _MISSING:
             raise ValueError(
                 f"Unknown compresser {repr(compression)}. "
-                f"Available values are {list(cls._compresser_registry)}"
+                f"Available values are {list(cls._compression_info)}"
             )
+        return info.compresser
 
     @classmethod
     def get_compresser_from_extension(cls, extension: str) -> Type[BaseCompresser]:
@@ -64,9 +94,9 @@ class _compresser_registry:
         ----------
         extension : str
             The file extension, for example ".zip".
-            Note that the dot characters will be striped from the left of any supplied extension
-            before the lookup it. This means that ".zip" and "zip" will be considered equivalent
-            extensions.
+            Note that a single leading dot will be stripped from any supplied extension and that
+            it will be lowercased before looking it up. This means that ".zip", "zip" and ".ZIP"
+            will be considered equivalent extensions.
 
         Raises
         ------
@@ -78,7 +108,7 @@ class _compresser_registry:
         Type[BaseCompresser]
             The compresser class associated to the extension.
         """
-        return cls._compresser_registry[cls.get_compression_from_extension(extension)]
+        return cls.get_compresser(cls.get_compression_from_extension(extension))
 
     @classmethod
     def get_compression_from_extension(cls, extension: str) -> Optional[str]:
@@ -88,9 +118,9 @@ class _compresser_registry:
         ----------
         extension : str
             The file extension, for example ".zip".
-            Note that the dot characters will be striped from the left of any supplied extension
-            before the lookup it. This means that ".zip" and "zip" will be considered equivalent
-            extensions.
+            Note that a single leading dot will be stripped from any supplied extension and that
+            it will be lowercased before looking it up. This means that ".zip", "zip" and ".ZIP"
+            will be considered equivalent extensions.
 
         Raises
         ------
@@ -102,13 +132,15 @@ class _compresser_registry:
         Optional[str]
             The compression name associated to the extension.
         """
-        try:
-            return cls._compression_extension_map[extension.lstrip(".")]
-        except Exception:
+        compression = _lookup(
+            cls._compression_extension_map, _normalize_extension(extension)
+        )
+        if compression is _MISSING:
             raise ValueError(
                 f"Unregistered extension {repr(extension)}. "
                 f"Registered extensions are {list(cls._compression_extension_map)}"
             )
+        return compression
 
     @classmethod
     def register_compresser(
@@ -135,9 +167,9 @@ class _compresser_registry:
             the compression's default extension name. For example, if ``extensions = ["bz2", "bz"]``
             both the extensions ``"bz2"`` and ``"bz"`` will be registered to the ``compression``,
             but ``"bz2"`` will be taken as the compression's default extension.
-            Note that the dot characters will be striped from the left of any supplied extension
-            before registering it. This means that ".zip" and "zip" will be considered equivalent
-            extensions.
+            Note that a single leading dot will be stripped from any supplied extension and that
+            it will be lowercased before registering it. This means that ".zip", "zip" and ".ZIP"
+            will be considered equivalent extensions.
         default_write_mode : str
             The write mode with which to open the file object stream by default.
         default_read_mode : str
@@ -152,20 +184,18 @@ class _compresser_registry:
             If the supplied compresser is not a :class:`~compress_pickle.compressers.base.BaseCompresser`
             subclass.
         """
-        if compression in cls._compresser_registry:
+        if compression in cls._compression_info:
             raise ValueError(
                 f"A compresser with name {repr(compression)} is already registered. "
                 "Please choose a different name."
             )
-        try:
-            _subclass = issubclass(compresser, BaseCompresser)
-            if not _subclass:
-                raise TypeError()
-        except Exception:
+        if not (
+            isinstance(compresser, type) and issubclass(compresser, BaseCompresser)
+        ):
             raise TypeError(
                 f"The supplied compresser {compresser} is not a derived from {BaseCompresser}"
             )
-        extensions = [ext.lstrip(".") for ext in extensions]
+        extensions = [_normalize_extension(ext) for ext in extensions]
         for ext in extensions:
             if ext in cls._compression_extension_map:
                 raise ValueError(
@@ -174,10 +204,13 @@ class _compresser_registry:
                     f"{repr(cls._compression_extension_map[ext])}. Please use a different extension "
                     "instead."
                 )
-        cls._compresser_registry[compression] = compresser
+        cls._compression_info[compression] = _CompressionInfo(
+            compresser=compresser,
+            default_write_mode=default_write_mode,
+            default_read_mode=default_read_mode,
+            default_extension=extensions[0] if extensions else None,
+        )
         cls._compression_extension_map.update({ext: compression for ext in extensions})
-        cls._compresser_default_write_modes[compression] = default_write_mode
-        cls._compresser_default_read_modes[compression] = default_read_mode
 
     @classmethod
     def get_compression_write_mode(cls, compression: Optional[str]) -> str:
@@ -198,14 +231,10 @@ class _compresser_registry:
         ValueError
             If the default write mode of the supplied ``compression`` is not known.
         """
-        try:
-            return cls._compresser_default_write_modes[compression]
-        except Exception:  # pragma: no cover
-            raise ValueError(
-                "Unknown compression {}. Available values are: {}".format(
-                    repr(compression), list(cls._compresser_default_write_modes)
-                )
-            )
+        info = _lookup(cls._compression_info, compression)
+        if info is _MISSING:  # pragma: no cover
+            raise _unknown_compression_error(compression)
+        return info.default_write_mode
 
     @classmethod
     def get_compression_read_mode(cls, compression: Optional[str]) -> str:
@@ -226,14 +255,10 @@ class _compresser_registry:
         ValueError
             If the default write mode of the supplied ``compression`` is not known.
         """
-        try:
-            return cls._compresser_default_read_modes[compression]
-        except Exception:  # pragma: no cover
-            raise ValueError(
-                "Unknown compression {}. Available values are: {}".format(
-                    repr(compression), list(cls._compresser_default_read_modes)
-                )
-            )
+        info = _lookup(cls._compression_info, compression)
+        if info is _MISSING:  # pragma: no cover
+            raise _unknown_compression_error(compression)
+        return info.default_read_mode
 
     @classmethod
     def add_compression_alias(cls, alias: str, compression: Optional[str]):
@@ -252,24 +277,15 @@ class _compresser_registry:
             If the supplied ``compression`` is not known or if the supplied ``alias``
             is already contained in the registry.
         """
-        if alias in cls._compresser_registry:
+        if alias in cls._compression_info:
             raise ValueError(
                 f"The alias {repr(alias)} is already registered, please choose a different alias."
             )
-        if compression not in cls._compresser_registry:
-            raise ValueError(
-                "Unknown compression {}. Available values are: {}".format(
-                    repr(compression), list(cls._compresser_registry)
-                )
-            )
-        cls._compresser_registry[alias] = cls._compresser_registry[compression]
-        cls._compresser_default_write_modes[
-            alias
-        ] = cls._compresser_default_write_modes[compression]
-        cls._compresser_default_read_modes[alias] = cls._compresser_default_read_modes[
-            compression
-        ]
-        cls._compression_aliases[alias] = compression
+        if compression not in cls._compression_info:
+            raise _unknown_compression_error(compression)
+        cls._compression_info[alias] = cls._compression_info[compression]._replace(
+            alias_of=compression
+        )
 
 
 get_compresser = _compresser_registry.get_compresser
@@ -306,7 +322,7 @@ def get_known_compressions() -> List[Optional[str]]:
     compressions : List[Optional[str]]
         List of known compression protocol names.
     """
-    return list(_compresser_registry._compresser_registry)
+    return list(_compresser_registry._compression_info)
 
 
 def validate_compression(compression: Optional[str], infer_is_valid: bool = True):
@@ -329,40 +345,30 @@ def validate_compression(compression: Optional[str], infer_is_valid: bool = True
     ValueError
         If the supplied ``compression`` is not supported.
     """
-    if compression in get_known_compressions():
+    if _lookup(_compresser_registry._compression_info, compression) is not _MISSING:
         return True
     elif infer_is_valid and compression == "infer":
         return True
-    raise ValueError(
-        "Unknown compression {}. Available values are: {}".format(
-            repr(compression), get_known_compressions()
-        )
-    )
+    raise _unknown_compression_error(compression)
 
 
 def get_default_compression_mapping() -> Dict[Optional[str], str]:
     """Get a mapping from known compression protocols to the default filename extensions.
 
+    The default extension of each compression is the first extension with which it was
+    registered. Aliases share the default extension of the compression that they refer to.
+
     Returns
     -------
     compression_map : Dict[Optional[str], str]
         Dictionary that maps known compression protocol names to their default
         file extension.
     """
-    output = {}
-    for (
-        extension,
-        compresser_name,
-    ) in _compresser_registry._compression_extension_map.items():
-        if compresser_name not in output:
-            output[compresser_name] = extension
-    output.update(
-        {
-            alias: output[compression]
-            for alias, compression in _compresser_registry._compression_aliases.items()
-        }
-    )
-    return output
+    return {
+        compression: info.default_extension
+        for compression, info in _compresser_registry._compression_info.items()
+        if info.default_extension is not None
+    }
 
 
 def list_registered_compressers() -> List[Type[BaseCompresser]]:  # pragma: no cover
@@ -373,4 +379,4 @@ def list_registered_compressers() -> List[Type[BaseCompresser]]:  # pragma: no c
     List[Type[BaseCompresser]]
         The list of registered compresser classes.
     """
-    return list(_compresser_registry._compresser_registry.values())
+    return [info.compresser for info in _compresser_registry._compression_info.values()]
@@ -1,9 +1,16 @@
+import os
 import zipfile
-from io import IOBase
 from os.path import basename
-from typing import IO, Union
+from typing import IO, Optional, Union
 
-from .base import PATH_TYPES, BaseCompresser, PathType
+from .base import (
+    _WRITE_BUFFER_SIZE,
+    PATH_OR_STREAM_TYPES,
+    PATH_TYPES,
+    BaseCompresser,
+    PathType,
+    _buffered_writer,
+)
 from .registry import register_compresser
 
 
@@ -17,7 +24,7 @@ class ZipfileCompresser(BaseCompresser):
     directory, that can hold other directories or files. These are called members of the archive.
     The ``ZipfileCompresser`` creates the input/output stream by opening a member file in the
     opened ``ZipFile`` archive. The name of the archive member can be chosen with the ``arcname``
-    argument.
+    argument. Other members of the same archive can later be opened with :meth:`open_member`.
 
     Parameters
     ----------
@@ -40,6 +47,9 @@ class ZipfileCompresser(BaseCompresser):
     zipfile_compression : Optional[str]
         If not ``None``, it is passed as the ``compression`` keyword argument to
         ``zipfile.Zipfile(...)``.
+    buffer_size : Optional[int]
+        Size of the ``io.BufferedWriter`` that batches the pickler's writes before they reach the
+        compressor. Only used when writing. If ``None``, writes are not buffered.
     kwargs
         Any other key word arguments that are passed to ``zipfile.ZipFile``.
     """
@@ -52,28 +62,50 @@ class ZipfileCompresser(BaseCompresser):
         arcname=None,
         pwd=None,
         zipfile_compression=None,
+        buffer_size: Optional[int] = _WRITE_BUFFER_SIZE,
         **kwargs,
     ):
         if zipfile_compression is not None:
             kwargs["compression"] = zipfile_compression
-        if not isinstance(path, PATH_TYPES + (IOBase,)):
+        if not isinstance(path, PATH_OR_STREAM_TYPES):
             raise TypeError(f"Unhandled path type {type(path)}")
         self._arch = zipfile.ZipFile(path, mode=mode, **kwargs)  # type: ignore
+        self._mode = mode
+        self._buffer_size = buffer_size
         if arcname is None:
             if isinstance(path, PATH_TYPES):
-                file_path = basename(path)
+                arcname = basename(os.fsdecode(path))
             else:
-                file_path = getattr(path, "name", "default")
-            arcname = file_path
-        else:
-            file_path = arcname
-        self._stream = self._arch.open(file_path, mode=mode, pwd=pwd)  # type: ignore
+                arcname = getattr(path, "name", "default")
+        self._stream = self._open_member(arcname, pwd=pwd)
+
+    def _open_member(self, arcname: str, pwd=None) -> IO[bytes]:
+        stream = self._arch.open(arcname, mode=self._mode, pwd=pwd)  # type: ignore
+        return _buffered_writer(stream, self._mode, self._buffer_size)
+
+    def open_member(self, arcname: str, pwd=None):
+        """Close the current archive member and open a different one in the same archive.
+
+        This allows many objects to be written to (or read from) different members of a single
+        ``zipfile.ZipFile`` without having to close and reopen the archive for each of them.
+        After calling this method, :meth:`get_stream` returns the newly opened member.
+
+        Parameters
+        ----------
+        arcname : str
+            The name of the archive member that will be used as the binary input/output stream.
+        pwd : Optional[str]
+            The password used to decrypt encrypted ZIP files.
+        """
+        self._stream.close()
+        self._stream = self._open_member(arcname, pwd=pwd)
 
     def close(self):
         """Close the input/output binary stream and the ``ZipFile``.
 
-        This closes the ``zipfile.ZipFile`` instance and archive member file-objects that
-        are created during the ``__init__``.
+        This closes the ``zipfile.ZipFile`` instance and the archive member file-object that
+        is currently open. When writing, the buffered data is flushed into the archive member
+        before it is closed.
         """
         self._stream.close()
         self._arch.close()
@@ -1,4 +1,3 @@
-from functools import singledispatch
 from typing import Any
 
 from ..compressers.base import BaseCompresser
@@ -7,14 +6,13 @@ from ..picklers.base import BasePicklerIO
 __all__ = ["compress_and_pickle", "uncompress_and_unpickle"]
 
 
-@singledispatch
 def compress_and_pickle(compresser: Any, pickler: BasePicklerIO, obj: Any, **kwargs):
     """Take an object, serialize it and write it to a compresser's stream.
 
-    This is the main serialization function. It works as a singledispatch function, and its
-    implementation is dependent on the type of the supplied ``compresser``. The default
-    implementation only supports :class:`~compress_pickle.compressers.base.BaseCompresser`
-    instances.
+    This function is kept for backwards compatibility and simply forwards to
+    :meth:`compresser.dump <compress_pickle.compressers.base.BaseCompresser.dump>`, which
+    should be preferred. It only supports
+    :class:`~compress_pickle.compressers.base.BaseCompresser` instances.
 
     The ``compresser`` is used to get the stream onto which to write the serialized ``obj``.
     The ``pickler`` instance is the object that is responsible for `dumping` the ``obj`` to the
@@ -37,29 +35,24 @@ def compress_and_pickle(compresser: Any, pickler: BasePicklerIO, obj: Any, **kwa
     ------
     NotImplementedError
         If the ``compresser`` is not an instance of
-        :class:`~compress_pickle.compressers.base.BaseCompresser`
+        :class:`~compress_pickle.compressers.base.BaseCompresser`. This check is skipped
+        when python runs with optimizations enabled (``python -O``).
     """
-    raise NotImplementedError(
-        f"compress_and_pickle is not implemented for the supplied compresser type: "
-        f"{type(compresser)}"
-    )
+    if __debug__ and not isinstance(compresser, BaseCompresser):
+        raise NotImplementedError(
+            f"compress_and_pickle is not implemented for the supplied compresser type: "
+            f"{type(compresser)}"
+        )
+    compresser.dump(pickler, obj, **kwargs)
 
 
-@compress_and_pickle.register(BaseCompresser)
-def default_compress_and_pickle(
-    compresser: BaseCompresser, pickler: BasePicklerIO, obj: Any, **kwargs
-):
-    pickler.dump(obj=obj, stream=compresser.get_stream(), **kwargs)
-
-
-@singledispatch
 def uncompress_and_unpickle(compresser: Any, pickler: BasePicklerIO, **kwargs) -> Any:
     """Load and uncompress an object from a compresser's stream.
 
-    This is the main loading function. It works as a singledispatch function, and its
-    implementation is dependent on the type of the supplied ``compresser``. The default
-    implementation only supports :class:`~compress_pickle.compressers.base.BaseCompresser`
-    instances.
+    This function is kept for backwards compatibility and simply forwards to
+    :meth:`compresser.load <compress_pickle.compressers.base.BaseCompresser.load>`, which
+    should be preferred. It only supports
+    :class:`~compress_pickle.compressers.base.BaseCompresser` instances.
 
     The ``compresser`` is used to get the stream from which to load the serialized ``obj``.
     The ``pickler`` instance is the object that is responsible for `loading` the ``obj`` from the
@@ -84,16 +77,12 @@ def uncompress_and_unpickle(compresser: Any, pickler: BasePicklerIO, **kwargs) -
     ------
     NotImplementedError
         If the ``compresser`` is not an instance of
-        :class:`~compress_pickle.compressers.base.BaseCompresser`
+        :class:`~compress_pickle.compressers.base.BaseCompresser`. This check is skipped
+        when python runs with optimizations enabled (``python -O``).
     """
-    raise NotImplementedError(
-        f"uncompress_and_unpickle is not implemented for the supplied compresser type: "
-        f"{type(compresser)}"
-    )
-
-
-@uncompress_and_unpickle.register(BaseCompresser)
-def default_uncompress_and_unpickle(
-    compresser: BaseCompresser, pickler: BasePicklerIO, **kwargs
-) -> Any:
-    return pickler.load(stream=compresser.get_stream(), **kwargs)
+    if __debug__ and not isinstance(compresser, BaseCompresser):
+        raise NotImplementedError(
+            f"uncompress_and_unpickle is not implemented for the supplied compresser type: "
+            f"{type(compresser)}"
+        )
+    return compresser.load(pickler, **kwargs)
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import IO, Any
+from typing import IO, Any, Iterable
 
 __all__ = ["BasePicklerIO"]
 
@@ -11,6 +11,8 @@ class BasePicklerIO:
     binary stream.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def dump(self, obj: Any, stream: IO[bytes], **kwargs):  # pragma: no cover
         """Write a serialized binary representation of an object to a stream.
@@ -26,6 +28,25 @@ class BasePicklerIO:
         """
         pass
 
+    def dump_iter(self, objs: Iterable[Any], stream: IO[bytes], **kwargs):
+        """Write the serialized binary representations of many objects to a stream.
+
+        The objects are written one after the other, so they can be read back by calling
+        :meth:`load` once per object on the same stream (as long as the serialization format
+        supports it). Subclasses may override this method to reuse their pickler between objects.
+
+        Parameters
+        ----------
+        objs : Iterable[Any]
+            The python objects that must be serialized and written.
+        stream : IO[bytes]
+            The binary stream (file-like object) where the serialized objects must be written to.
+        kwargs
+            Any extra keyword arguments that are passed to :meth:`dump` for each object.
+        """
+        for obj in objs:
+            self.dump(obj, stream, **kwargs)
+
     @abstractmethod
     def load(self, stream: IO[bytes], **kwargs):  # pragma: no cover
         """Load a serialized binary representation of an object from a stream.
@@ -1,21 +1,21 @@
-from typing import IO, Any
+from importlib.util import find_spec
+from typing import IO, Any, Iterable
 
 from .base import BasePicklerIO
 from .registry import register_pickler
 
-try:
-    import cloudpickle
-
-    _cloudpickle_available = True
-except ImportError:  # pragma: no cover
-    _cloudpickle_available = False
+# cloudpickle is only imported the first time that it is used to dump or load an object, so that
+# importing compress_pickle does not pay for cloudpickle's own import time and memory.
+_cloudpickle_available = find_spec("cloudpickle") is not None
 
 
 __all__ = ["CloudPicklerIO"]
 
 
 class CloudPicklerIO(BasePicklerIO):
-    """A PicklerIO class that wraps ``cloudpickle.dump`` and ``cloudpickle.load``."""
+    """A PicklerIO class that wraps ``cloudpickle.CloudPickler`` and ``cloudpickle.load``."""
+
+    __slots__ = ()
 
     def __init__(self):
         if not _cloudpickle_available:
@@ -35,9 +35,34 @@ class CloudPicklerIO(BasePicklerIO):
         stream : IO[bytes]
             The binary stream (file-like object) where the serialized object must be written to.
         kwargs
-            Any extra keyword arguments to pass to ``cloudpickle.dump``.
+            Any extra keyword arguments to pass to ``cloudpickle.CloudPickler``.
         """
-        cloudpickle.dump(obj, stream, **kwargs)
+        import cloudpickle
+
+        cloudpickle.CloudPickler(stream, **kwargs).dump(obj)
+
+    def dump_iter(self, objs: Iterable[Any], stream: IO[bytes], **kwargs):
+        """Write the serialized binary representations of many objects to a stream.
+
+        A single ``cloudpickle.CloudPickler`` is created for the whole ``stream`` and its memo
+        is cleared after each object, so every object is pickled independently of the others
+        and can be read back by calling :meth:`load` once per object.
+
+        Parameters
+        ----------
+        objs : Iterable[Any]
+            The python objects that must be serialized and written.
+        stream : IO[bytes]
+            The binary stream (file-like object) where the serialized objects must be written to.
+        kwargs
+            Any extra keyword arguments to pass to ``cloudpickle.CloudPickler``.
+        """
+        import cloudpickle
+
+        pickler = cloudpickle.CloudPickler(stream, **kwargs)
+        for obj in objs:
+            pickler.dump(obj)
+            pickler.clear_memo()
 
     def load(self, stream: IO[bytes], **kwargs):
         """Load a serialized binary representation of an object from a stream.
@@ -54,6 +79,8 @@ class CloudPicklerIO(BasePicklerIO):
         obj : Any
             The python object that was loaded.
         """
+        import cloudpickle
+
         return cloudpickle.load(stream, **kwargs)
 
 
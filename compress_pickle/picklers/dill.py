@@ -1,14 +1,12 @@
-from typing import IO, Any
+from importlib.util import find_spec
+from typing import IO, Any, Iterable
 
 from .base import BasePicklerIO
 from .registry import register_pickler
 
-try:
-    import dill
-
-    _dill_available = True
-except ImportError:  # pragma: no cover
-    _dill_available = False
+# dill is only imported the first time that it is used to dump or load an object, so that
+# importing compress_pickle does not pay for dill's own import time and memory.
+_dill_available = find_spec("dill") is not None
 
 
 __all__ = ["DillPicklerIO"]
@@ -17,6 +15,8 @@ __all__ = ["DillPicklerIO"]
 class DillPicklerIO(BasePicklerIO):
     """A PicklerIO class that wraps ``dill.dump`` and ``dill.load``."""
 
+    __slots__ = ()
+
     def __init__(self):
         if not _dill_available:
             raise RuntimeError(
@@ -36,9 +36,38 @@ class DillPicklerIO(BasePicklerIO):
             The binary stream (file-like object) where the serialized object must be written to.
         kwargs
             Any extra keyword arguments to pass to `dill.dump <https://dill.readthedocs.io/en/latest/dill.html#dill._dill.dump>`_.
+            If no ``protocol`` is supplied, ``dill.settings["protocol"]`` is used.
         """
+        import dill
+
         dill.dump(obj, stream, **kwargs)
 
+    def dump_iter(self, objs: Iterable[Any], stream: IO[bytes], **kwargs):
+        """Write the serialized binary representations of many objects to a stream.
+
+        A single ``dill.Pickler`` is created for the whole ``stream`` and its memo is cleared after
+        each object, so every object is pickled independently of the others and can be read
+        back by calling :meth:`load` once per object.
+
+        Parameters
+        ----------
+        objs : Iterable[Any]
+            The python objects that must be serialized and written.
+        stream : IO[bytes]
+            The binary stream (file-like object) where the serialized objects must be written to.
+        kwargs
+            Any extra keyword arguments to pass to ``dill.Pickler``.
+            If no ``protocol`` is supplied, ``dill.settings["protocol"]`` is used.
+        """
+        import dill
+
+        # Unlike dill.dump, dill.Pickler ignores dill.settings, so apply the configured protocol
+        kwargs.setdefault("protocol", dill.settings["protocol"])
+        pickler = dill.Pickler(stream, **kwargs)
+        for obj in objs:
+            pickler.dump(obj)
+            pickler.clear_memo()
+
     def load(self, stream: IO[bytes], **kwargs):
         """Load a serialized binary representation of an object from a stream.
 
@@ -54,6 +83,8 @@ class DillPicklerIO(BasePicklerIO):
         obj : Any
             The python object that was loaded.
         """
+        import dill
+
         return dill.load(stream, **kwargs)
 
 
@@ -1,7 +1,5 @@
-from typing import IO, Any
-
-import io
 import json
+from typing import IO, Any
 
 from .base import BasePicklerIO
 from .registry import register_pickler
@@ -12,6 +10,8 @@ __all__ = ["JSONPicklerIO"]
 class JSONPicklerIO(BasePicklerIO):
     """A PicklerIO class that wraps ``json.dump`` and ``json.load``."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -25,12 +25,9 @@ class JSONPicklerIO(BasePicklerIO):
         stream : IO[bytes]
             The binary stream (file-like object) where the serialized object must be written to.
         kwargs
-            Any extra keyword arguments to pass to `json.dump <https://docs.python.org/3/library/json.html#json.dump>`_.
+            Any extra keyword arguments to pass to `json.dumps <https://docs.python.org/3/library/json.html#json.dumps>`_.
         """
-        utf8_stream = io.TextIOWrapper(stream, "utf-8")
-        json.dump(obj, utf8_stream, **kwargs)
-        # prevent closing of underlying stream by TextIOWrapper.__del__
-        utf8_stream.detach()
+        stream.write(json.dumps(obj, **kwargs).encode("utf-8"))
 
     def load(self, stream: IO[bytes], **kwargs):
         """Load a serialized JSON representation of an object from a stream.
@@ -40,18 +37,14 @@ class JSONPicklerIO(BasePicklerIO):
         stream : IO[bytes]
             The binary stream (file-like object) from where the serialized object must be loaded.
         kwargs
-            Any extra keyword arguments to pass to `json.load <https://docs.python.org/3/library/json.html#json.load>`_.
+            Any extra keyword arguments to pass to `json.loads <https://docs.python.org/3/library/json.html#json.loads>`_.
 
         Returns
         -------
         obj : Any
             The python object that was loaded.
         """
-        utf8_stream = io.TextIOWrapper(stream, "utf-8")
-        obj = json.load(utf8_stream, **kwargs)
-        # prevent closing of underlying stream by TextIOWrapper.__del__
-        utf8_stream.detach()
-        return obj
+        return json.loads(stream.read().decode("utf-8"), **kwargs)
 
 
 register_pickler("json", JSONPicklerIO)
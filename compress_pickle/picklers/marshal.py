@@ -10,6 +10,8 @@ __all__ = ["MarshalPicklerIO"]
 class MarshalPicklerIO(BasePicklerIO):
     """A PicklerIO class that wraps standard :func:`marshal.dump` and :func:`marshal.load`."""
 
+    __slots__ = ()
+
     def dump(self, obj: Any, stream: IO[bytes], **kwargs):
         """Write a serialized binary representation of an object to a stream.
 
@@ -20,11 +22,20 @@ class MarshalPicklerIO(BasePicklerIO):
         stream : IO[bytes]
             The binary stream (file-like object) where the serialized object must be written to.
         kwargs
-            Any extra keyword arguments to pass to :func:`marshal.dump`.
+            The only supported keyword argument is ``version``, which is passed to
+            :func:`marshal.dump`. If it is not supplied, :data:`marshal.version` is used.
+
+        Raises
+        ------
+        TypeError
+            If any keyword argument other than ``version`` is supplied.
         """
-        args = kwargs.pop("version", tuple())
-        args += tuple(kwargs.values())
-        marshal.dump(obj, stream, *args)
+        version = kwargs.pop("version", marshal.version)
+        if kwargs:
+            raise TypeError(
+                f"marshal.dump got unexpected keyword arguments {list(kwargs)}"
+            )
+        marshal.dump(obj, stream, version)
 
     def load(self, stream: IO[bytes], **kwargs):
         """Load a serialized binary representation of an object from a stream.
@@ -2,18 +2,49 @@ import pickle
 import pickletools
 from typing import IO, Any
 
+from .base import BasePicklerIO
 from .pickle import BuiltinPicklerIO
 from .registry import register_pickler
 
 __all__ = ["OptimizedPicklerIO"]
 
+_MEMO_OPCODES = frozenset(["PUT", "BINPUT", "LONG_BINPUT", "MEMOIZE"])
+# Same as pickle._Framer._FRAME_SIZE_TARGET
+_FRAME_SIZE_TARGET = 64 * 1024
+
+
+def _has_optimizable_opcodes(data: bytes) -> bool:
+    """Check if optimize can change a pickle.
+
+    :func:`pickletools.optimize` drops unused memo stores and rebuilds the protocol 4+ frames.
+    A pickle without memo stores that fits in a single frame smaller than the framing target
+    is returned unchanged.
+    """
+    frames = 0
+    for opcode, arg, _ in pickletools.genops(data):
+        if opcode.name in _MEMO_OPCODES:
+            return True
+        if opcode.name == "FRAME":
+            frames += 1
+            if frames > 1 or arg >= _FRAME_SIZE_TARGET:
+                return True
+    return False
+
 
 class OptimizedPicklerIO(BuiltinPicklerIO):
     """A PicklerIO class that combines :func:`pickletools.optimize` and standard :func:`pickle.dump`."""
 
+    __slots__ = ()
+
     def dump(self, obj: Any, stream: IO[bytes], **kwargs):
-        data = pickletools.optimize(pickle.dumps(obj, **kwargs))
+        kwargs.setdefault("protocol", pickle.HIGHEST_PROTOCOL)
+        data = pickle.dumps(obj, **kwargs)
+        if _has_optimizable_opcodes(data):
+            data = pickletools.optimize(data)
         stream.write(data)
 
+    # Every object must go through dump to be optimized, so don't reuse a single pickler
+    dump_iter = BasePicklerIO.dump_iter
+
 
 register_pickler("optimized_pickle", OptimizedPicklerIO)
@@ -1,15 +1,40 @@
 import pickle
-from typing import IO, Any
+from typing import IO, Any, Iterable
 
 from .base import BasePicklerIO
 from .registry import register_pickler
 
+try:
+    from pickle import PickleBuffer
+except ImportError:  # pragma: no cover
+    PickleBuffer = None
+
 __all__ = ["BuiltinPicklerIO"]
 
 
+class _PickleBufferWriter:
+    """Write-only adapter that hands the buffers of :class:`pickle.PickleBuffer` to a stream.
+
+    With protocol 5, large ``bytes``, ``bytearray`` and ``numpy.ndarray`` payloads are written
+    to the file as they are, without being copied into the pickler's frame. Some compression
+    streams can't handle ``PickleBuffer`` instances, so they are converted to a ``memoryview``
+    over the same memory before being written.
+    """
+
+    def __init__(self, stream: IO[bytes]):
+        self._stream = stream
+
+    def write(self, data) -> int:
+        if isinstance(data, PickleBuffer):
+            data = data.raw()
+        return self._stream.write(data)
+
+
 class BuiltinPicklerIO(BasePicklerIO):
     """A PicklerIO class that wraps standard :func:`pickle.dump` and :func:`pickle.load`."""
 
+    __slots__ = ()
+
     def dump(self, obj: Any, stream: IO[bytes], **kwargs):
         """Write a serialized binary representation of an object to a stream.
 
@@ -20,12 +45,46 @@ class BuiltinPicklerIO(BasePicklerIO):
         stream : IO[bytes]
             The binary stream (file-like object) where the serialized object must be written to.
         kwargs
-            Any extra keyword arguments to pass to :func:`pickle.dump`.
+            Any extra keyword arguments to pass to :func:`pickle.dump`. If no ``protocol`` is
+            supplied, :data:`pickle.HIGHEST_PROTOCOL` is used.
+
+        Notes
+        -----
+        With protocol 5, large ``bytes``, ``bytearray`` and contiguous ``numpy.ndarray`` members
+        of ``obj`` are written straight into the ``stream`` without being copied into an
+        intermediate ``bytes`` object. A ``buffer_callback`` can also be passed to get them
+        out-of-band instead. The same buffers must then be passed to :meth:`load` as
+        ``buffers``.
+        """
+        kwargs.setdefault("protocol", pickle.HIGHEST_PROTOCOL)
+        if PickleBuffer is not None:
+            stream = _PickleBufferWriter(stream)  # type: ignore
+        pickle.dump(obj, stream, **kwargs)
+
+    def dump_iter(self, objs: Iterable[Any], stream: IO[bytes], **kwargs):
+        """Write the serialized binary representations of many objects to a stream.
+
+        A single :class:`pickle.Pickler` is created for the whole ``stream`` and its memo is
+        cleared after each object, so every object is pickled independently of the others and
+        can be read back by calling :meth:`load` once per object.
+
+        Parameters
+        ----------
+        objs : Iterable[Any]
+            The python objects that must be serialized and written.
+        stream : IO[bytes]
+            The binary stream (file-like object) where the serialized objects must be written to.
+        kwargs
+            Any extra keyword arguments to pass to :class:`pickle.Pickler`. If no ``protocol``
+            is supplied, :data:`pickle.HIGHEST_PROTOCOL` is used.
         """
-        if kwargs.get("protocol", None) == 5:
-            stream.write(pickle.dumps(obj, **kwargs))
-        else:
-            pickle.dump(obj, stream, **kwargs)
+        kwargs.setdefault("protocol", pickle.HIGHEST_PROTOCOL)
+        if PickleBuffer is not None:
+            stream = _PickleBufferWriter(stream)  # type: ignore
+        pickler = pickle.Pickler(stream, **kwargs)
+        for obj in objs:
+            pickler.dump(obj)
+            pickler.clear_memo()
 
     def load(self, stream: IO[bytes], **kwargs):
         """Load a serialized binary representation of an object from a stream.
@@ -35,7 +94,9 @@ class BuiltinPicklerIO(BasePicklerIO):
         stream : IO[bytes]
             The binary stream (file-like object) from where the serialized object must be loaded.
         kwargs
-            Any extra keyword arguments to pass to :func:`pickle.load`.
+            Any extra keyword arguments to pass to :func:`pickle.load`. For example, ``buffers``
+            with the out-of-band buffers that were collected by the ``buffer_callback`` during
+            :meth:`dump`.
 
         Returns
         -------
@@ -9,6 +9,8 @@ __all__ = [
     "list_registered_picklers",
 ]
 
+_MISSING = object()
+
 
 class _pickler_registry:
     _pickler_registry: Dict[str, Type[BasePicklerIO]] = {}
@@ -34,12 +36,15 @@ class _pickler_registry:
             The PicklerIO class associated to the pickler ``name``.
         """
         try:
-            return cls._pickler_registry[name]
-        except Exception:
+            pickler = cls._pickler_registry.get(name, _MISSING)
+        except TypeError:  # Unhashable names can never be registered
+            pickler = _MISSING
+        if pickler is _MISSING:
             raise ValueError(
                 f"Unknown pickler {repr(name)}. "
                 f"Available values are {list(cls._pickler_registry)}"
             )
+        return pickler
 
     @classmethod
     def register_pickler(
@@ -103,9 +108,8 @@ class _pickler_registry:
             )
         if pickler not in cls._pickler_registry:
             raise ValueError(
-                "Unknown pickler name {}. Available values are: {}".format(
-                    repr(pickler), list(cls._pickler_registry)
-                )
+                f"Unknown pickler name {repr(pickler)}. "
+                f"Available values are: {list(cls._pickler_registry)}"
             )
         cls._pickler_registry[alias] = cls._pickler_registry[pickler]
         cls._pickler_aliases[alias] = pickler
@@ -1,5 +1,4 @@
-import codecs
-from os import PathLike
+from os import PathLike, fspath
 from os.path import splitext
 from typing import IO, Optional, Union
 
@@ -11,11 +10,17 @@ from .compressers import (
     get_compression_write_mode,
     get_default_compression_mapping,
 )
+from .compressers.registry import _normalize_extension
 
 PATH_TYPES = (str, bytes, PathLike)
 PathType = Union[str, bytes, PathLike]
 FileType = IO[bytes]
 
+_DEFAULT_MODE_GETTERS = {
+    "write": get_compression_write_mode,
+    "read": get_compression_read_mode,
+}
+
 
 __all__ = [
     "instantiate_compresser",
@@ -31,7 +36,7 @@ def _stringyfy_path(path: Optional[PathType]) -> str:
         If ``path`` is a ``string`` instance, it is returned as is.
         If ``path`` is a ``bytes`` instance, it is decoded with utf8 codec.
         If it is ``os.PathLike`` or ``pathlib.PurePath`` then it is converted
-        to a string with ``str(path)``.
+        with ``os.fspath(path)`` (and decoded if that returns ``bytes``).
 
     Returns
     -------
@@ -44,16 +49,16 @@ def _stringyfy_path(path: Optional[PathType]) -> str:
         If the supplied ``path`` is not a ``PATH_TYPES`` instance.
 
     """
-    if not isinstance(path, PATH_TYPES):
-        raise TypeError(
-            "Cannot convert supplied path type to string. Supplied path: {}, "
-            "type: {}".format(path, type(path))
-        )
+    if isinstance(path, str):
+        return path
     if isinstance(path, bytes):
-        path = codecs.decode(path, "utf-8")
-    else:
-        path = str(path)
-    return path
+        return path.decode("utf-8")
+    if isinstance(path, PathLike):
+        return _stringyfy_path(fspath(path))
+    raise TypeError(
+        f"Cannot convert supplied path type to string. Supplied path: {path}, "
+        f"type: {type(path)}"
+    )
 
 
 def instantiate_compresser(
@@ -112,27 +117,29 @@ def instantiate_compresser(
     TypeError
         If the supplied ``path`` is not a ``PATH_TYPES`` instance and the ``compression`` is "infer".
     """
-    if isinstance(path, PATH_TYPES):
+    is_path = type(path) is str or isinstance(path, PATH_TYPES)
+    if is_path:
         _path: Optional[PathType] = _stringyfy_path(path)
     else:
         file_path = getattr(path, "name", None)
-        _path = file_path if isinstance(file_path, PATH_TYPES) else None
+        _path = (
+            _stringyfy_path(file_path) if isinstance(file_path, PATH_TYPES) else None
+        )
     if compression == "infer":
-        if not isinstance(path, PATH_TYPES) and _path is None:
+        if _path is None:
             raise TypeError(
                 f"Cannot infer the compression from a path that is not an instance of "
                 f"{PATH_TYPES}. Encountered {type(path)}"
             )
-        compression = _infer_compression_from_path(_path)
+        compression = _infer_compression_from_str(_path)  # type: ignore
     compresser_class = get_compresser(compression)
-    if set_default_extension and isinstance(path, PATH_TYPES):
-        _path = _set_default_extension(_path, compression)
-    if mode == "write":
-        mode = get_compression_write_mode(compression)
-    elif mode == "read":
-        mode = get_compression_read_mode(compression)
+    if set_default_extension and is_path:
+        _path = _set_default_extension_str(_path, compression)  # type: ignore
+    mode_getter = _DEFAULT_MODE_GETTERS.get(mode)
+    if mode_getter is not None:
+        mode = mode_getter(compression)
     compresser = compresser_class(
-        _path if isinstance(path, PATH_TYPES) else path, mode=mode, **kwargs  # type: ignore
+        _path if is_path else path, mode=mode, **kwargs  # type: ignore
     )
     return compresser
 
@@ -143,10 +150,21 @@ def _infer_compression_from_path(path: Optional[PathType]) -> Optional[str]:
             f"Cannot infer the compression from a path that is not an instance of "
             f"{PATH_TYPES}. Encountered {type(path)}"
         )
-    _, extension = splitext(_stringyfy_path(path))
+    return _infer_compression_from_str(_stringyfy_path(path))
+
+
+def _infer_compression_from_str(path: str) -> Optional[str]:
+    _, extension = splitext(path)
     return get_compression_from_extension(extension)
 
 
 def _set_default_extension(path: Optional[PathType], compression: Optional[str]) -> str:
-    root, current_ext = splitext(_stringyfy_path(path))
-    return root + "." + get_default_compression_mapping()[compression]
+    return _set_default_extension_str(_stringyfy_path(path), compression)
+
+
+def _set_default_extension_str(path: str, compression: Optional[str]) -> str:
+    default_extension = get_default_compression_mapping()[compression]
+    root, current_ext = splitext(path)
+    if _normalize_extension(current_ext) == default_extension:
+        return path
+    return root + "." + default_extension
@@ -19,12 +19,14 @@ URL = "https://github.com/lucianopaz/compress_pickle"
 
 lz4_requires = ["lz4"]
 dill_requires = ["dill"]
-cloudpickle_requires = ["cloudpickle"]
+cloudpickle_requires = ["cloudpickle>=2.0"]
+parallel_requires = ["rapidgzip", "indexed_bzip2"]
 extras_require = {
     "lz4": lz4_requires,
     "dill": dill_requires,
     "cloudpickle": cloudpickle_requires,
-    "full": lz4_requires + dill_requires + cloudpickle_requires,
+    "parallel": parallel_requires,
+    "full": lz4_requires + dill_requires + cloudpickle_requires + parallel_requires,
 }
 
 
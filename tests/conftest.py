@@ -1,24 +1,13 @@
 import pytest
 from fixtures import (
-    compressions,
     compressions_to_validate,
+    default_compression_mapping,
     dump_load,
-    file,
-    file_compressions,
-    file_types,
     hijack_cloudpickle,
     hijack_dill,
     hijack_lz4,
-    invalid_extensions,
-    pickler_method,
     picklers_to_validate,
-    preprocess_path_on_file_types,
-    preprocess_path_on_file_types_and_compressions,
-    preprocess_path_on_path_types,
     random_message,
-    set_default_extension,
+    random_payloads,
     simple_dump_and_remove,
-    unhandled_extensions,
-    valid_extensions,
-    wrong_compressions,
 )
@@ -5,9 +5,11 @@ import pytest
 from compress_pickle.compressers.base import BaseCompresser
 from compress_pickle.compressers.registry import (
     _compresser_registry,
+    _normalize_extension,
     add_compression_alias,
     get_compresser,
     get_compresser_from_extension,
+    get_compression_from_extension,
     get_compression_read_mode,
     get_compression_write_mode,
     get_default_compression_mapping,
@@ -15,6 +17,10 @@ from compress_pickle.compressers.registry import (
     register_compresser,
     validate_compression,
 )
+from fixtures import COMPRESSION_NAMES
+
+WRITE_MODES = frozenset(["w", "wb", "wb+"])
+READ_MODES = frozenset(["r", "rb", "rb+"])
 
 
 def test_compresser_registry():
@@ -55,15 +61,37 @@ def test_compresser_registry():
         ):
             register_compresser(name, proxy, extensions)
     finally:
-        del _compresser_registry._compresser_registry[name]
-        del _compresser_registry._compresser_default_write_modes[name]
-        del _compresser_registry._compresser_default_read_modes[name]
+        del _compresser_registry._compression_info[name]
         for extension in extensions:
-            del _compresser_registry._compression_extension_map[extension.lstrip(".")]
+            del _compresser_registry._compression_extension_map[
+                _normalize_extension(extension)
+            ]
+
+
+def test_only_one_leading_dot_is_stripped():
+    assert get_compression_from_extension(".gz") == get_compression_from_extension("gz")
+    with pytest.raises(ValueError, match="Unregistered extension '..gz'"):
+        get_compression_from_extension("..gz")
+
+
+@pytest.mark.parametrize("extension", [".GZ", "Gz", "gZ"])
+def test_extension_lookup_is_case_insensitive(extension):
+    assert get_compression_from_extension(extension) == "gzip"
 
 
 def test_get_known_compressions():
-    assert get_known_compressions() == list(_compresser_registry._compresser_registry)
+    assert get_known_compressions() == list(_compresser_registry._compression_info)
+
+
+@pytest.mark.parametrize("compression", COMPRESSION_NAMES, ids=str)
+def test_known_compressions(compression):
+    assert compression in get_known_compressions()
+
+
+@pytest.mark.parametrize("compression", COMPRESSION_NAMES, ids=str)
+def test_default_modes(compression):
+    assert get_compression_write_mode(compression) in WRITE_MODES
+    assert get_compression_read_mode(compression) in READ_MODES
 
 
 @pytest.mark.usefixtures("compressions_to_validate")
@@ -93,8 +121,8 @@ def test_get_default_compression_mapping():
             assert default_compression_mapping[compresser] != extension
 
 
-def test_register_wrong_type():
-    compresser = object
+@pytest.mark.parametrize("compresser", [object, object()], ids=["class", "instance"])
+def test_register_wrong_type(compresser):
     with pytest.raises(
         TypeError,
         match=re.escape(f"The supplied compresser {compresser} is not a derived from "),
@@ -139,7 +167,9 @@ def test_aliasing():
         assert get_compresser(name) is get_compresser(alias)
         assert get_compression_read_mode(name) == get_compression_read_mode(alias)
         assert get_compression_write_mode(name) == get_compression_write_mode(alias)
-        assert _compresser_registry._compression_aliases[alias] == name
+        assert _compresser_registry._compression_info[alias].alias_of == name
+        default_compression_mapping = get_default_compression_mapping()
+        assert default_compression_mapping[alias] == default_compression_mapping[name]
 
         with pytest.raises(
             ValueError, match=f"The alias {alias!r} is already registered"
@@ -149,12 +179,9 @@ def test_aliasing():
                 name,
             )
     finally:
-        del _compresser_registry._compresser_registry[name]
-        del _compresser_registry._compresser_default_write_modes[name]
-        del _compresser_registry._compresser_default_read_modes[name]
+        del _compresser_registry._compression_info[name]
         for extension in extensions:
-            del _compresser_registry._compression_extension_map[extension.lstrip(".")]
-        del _compresser_registry._compresser_registry[alias]
-        del _compresser_registry._compresser_default_write_modes[alias]
-        del _compresser_registry._compresser_default_read_modes[alias]
-        del _compresser_registry._compression_aliases[alias]
+            del _compresser_registry._compression_extension_map[
+                _normalize_extension(extension)
+            ]
+        del _compresser_registry._compression_info[alias]
@@ -1,7 +1,22 @@
+import bz2
+import gzip
+import io
+import sys
+import types
+import zipfile
+
 import pytest
 
+from compress_pickle import dump, load
+from compress_pickle.compressers.bz2 import Bz2Compresser
+from compress_pickle.compressers.gzip import GzipCompresser
 from compress_pickle.compressers.lz4 import Lz4Compresser
+from compress_pickle.compressers.lzma import LzmaCompresser
+from compress_pickle.compressers.no_compression import NoCompresser
 from compress_pickle.compressers.registry import list_registered_compressers
+from compress_pickle.compressers.zipfile import ZipfileCompresser
+from compress_pickle.picklers import BuiltinPicklerIO
+from fixtures import LZ4_AVAILABLE
 
 
 def test_compressers_on_unhandled_path():
@@ -21,3 +36,132 @@ def test_import_error_lz4():
         match="The lz4 compression protocol requires the lz4 package to be installed. ",
     ):
         Lz4Compresser("mock_path", mode="wb")
+
+
+def test_no_compresser_unbuffered(tmp_path):
+    path = str(tmp_path / "unbuffered.pkl")
+    obj = {"a": list(range(1000)), "b": b"x" * 200000}
+    compresser = NoCompresser(path, mode="wb", buffering=0)
+    try:
+        assert isinstance(compresser.get_stream(), io.FileIO)
+    finally:
+        compresser.close()
+    dump(obj, path, compression=None, buffering=0)
+    assert load(path, compression=None, buffering=0) == obj
+
+
+@pytest.mark.parametrize(
+    ("compresser_class", "stream_class"),
+    [(GzipCompresser, gzip.GzipFile), (Bz2Compresser, bz2.BZ2File)],
+    ids=["gzip", "bz2"],
+)
+def test_serial_decompression(tmp_path, compresser_class, stream_class):
+    path = str(tmp_path / "serial")
+    compresser_class(path, mode="wb").close()
+    compresser = compresser_class(path, mode="rb", parallel=False)
+    try:
+        assert isinstance(compresser.get_stream(), stream_class)
+    finally:
+        compresser.close()
+
+
+@pytest.mark.parametrize(
+    ("compresser_class", "module_name"),
+    [(GzipCompresser, "rapidgzip"), (Bz2Compresser, "indexed_bzip2")],
+    ids=["gzip", "bz2"],
+)
+def test_parallel_decompression(monkeypatch, tmp_path, compresser_class, module_name):
+    opened = []
+
+    def fake_open(path, parallelization):
+        opened.append(path)
+        return io.BytesIO()
+
+    fake_module = types.ModuleType(module_name)
+    fake_module.open = fake_open
+    monkeypatch.setitem(sys.modules, module_name, fake_module)
+    monkeypatch.setattr(
+        sys.modules[compresser_class.__module__], f"_{module_name}_available", True
+    )
+    path = tmp_path / "parallel"
+    compresser_class(path, mode="wb").close()
+    assert opened == []
+
+    compresser_class(path, mode="rb").close()
+    assert opened == [str(path)]
+
+    with open(path, "rb") as stream:
+        compresser_class(stream, mode="rb").close()
+    compresser_class(path, mode="rb", compresslevel=9).close()
+    compresser_class(path, mode="rb", parallel=False).close()
+    assert opened == [str(path)]
+
+
+@pytest.mark.parametrize(
+    ("compresser_class", "stream_class"),
+    [(GzipCompresser, gzip.GzipFile), (Bz2Compresser, bz2.BZ2File)],
+    ids=["gzip", "bz2"],
+)
+def test_default_compresslevel(monkeypatch, compresser_class, stream_class):
+    levels = []
+    original_init = stream_class.__init__
+
+    def spy_init(self, *args, compresslevel=9, **kwargs):
+        levels.append(compresslevel)
+        original_init(self, *args, compresslevel=compresslevel, **kwargs)
+
+    monkeypatch.setattr(stream_class, "__init__", spy_init)
+    compresser_class(io.BytesIO(), mode="wb").close()
+    compresser_class(io.BytesIO(), mode="wb", compresslevel=1).close()
+    assert levels == [6, 1]
+
+
+@pytest.mark.parametrize(
+    "compresser_class",
+    [
+        GzipCompresser,
+        Bz2Compresser,
+        LzmaCompresser,
+        pytest.param(
+            Lz4Compresser,
+            marks=pytest.mark.skipif(not LZ4_AVAILABLE, reason="lz4 is not installed"),
+        ),
+    ],
+    ids=["gzip", "bz2", "lzma", "lz4"],
+)
+def test_write_buffer(compresser_class):
+    output = io.BytesIO()
+    compresser = compresser_class(output, mode="wb")
+    assert isinstance(compresser.get_stream(), io.BufferedWriter)
+    compresser.dump(BuiltinPicklerIO(), list(range(1000)))
+    compresser.close()
+    unbuffered = compresser_class(io.BytesIO(), mode="wb", buffer_size=None)
+    assert not isinstance(unbuffered.get_stream(), io.BufferedWriter)
+    unbuffered.close()
+    compresser = compresser_class(io.BytesIO(output.getvalue()), mode="rb")
+    try:
+        assert compresser.load(BuiltinPicklerIO()) == list(range(1000))
+    finally:
+        compresser.close()
+
+
+def test_zipfile_open_member(tmp_path):
+    path = tmp_path / "archive.zip"
+    objs = {"first": [1, 2, 3], "second": {"a": "b"}}
+    pickler = BuiltinPicklerIO()
+    compresser = ZipfileCompresser(path, "w", arcname="first")
+    try:
+        compresser.dump(pickler, objs["first"])
+        compresser.open_member("second")
+        compresser.dump(pickler, objs["second"])
+    finally:
+        compresser.close()
+    with zipfile.ZipFile(path) as arch:
+        assert arch.namelist() == ["first", "second"]
+    compresser = ZipfileCompresser(path, "r", arcname="second")
+    try:
+        assert compresser.load(pickler) == objs["second"]
+        compresser.open_member("first")
+        assert compresser.load(pickler) == objs["first"]
+    finally:
+        compresser.close()
@@ -1,6 +1,10 @@
+import io
+
 import pytest
 
+from compress_pickle.compressers import NoCompresser
 from compress_pickle.io.base import compress_and_pickle, uncompress_and_unpickle
+from compress_pickle.picklers import BuiltinPicklerIO
 
 
 def test_compress_and_pickle_wrong_type():
@@ -17,3 +21,17 @@ def test_uncompress_and_unpickle_wrong_type():
         match="uncompress_and_unpickle is not implemented for the supplied compresser type: ",
     ):
         uncompress_and_unpickle(object(), object())
+
+
+def test_io_functions_forward_to_compresser_methods():
+    obj = {"a": [1, 2, 3]}
+    stream = io.BytesIO()
+    compresser = NoCompresser(stream, "wb")
+    compress_and_pickle(compresser, BuiltinPicklerIO(), obj)
+    expected = io.BytesIO()
+    NoCompresser(expected, "wb").dump(BuiltinPicklerIO(), obj)
+    assert stream.getvalue() == expected.getvalue()
+    stream.seek(0)
+    assert (
+        uncompress_and_unpickle(NoCompresser(stream, "rb"), BuiltinPicklerIO()) == obj
+    )
@@ -1,3 +1,7 @@
+import io
+import marshal
+import pickle
+import pickletools
 import sys
 
 import numpy as np
@@ -6,6 +10,9 @@ import pytest
 from compress_pickle import dumps, loads
 from compress_pickle.picklers.cloudpickle import CloudPicklerIO
 from compress_pickle.picklers.dill import DillPicklerIO
+from compress_pickle.picklers.pickle import BuiltinPicklerIO
+from compress_pickle.picklers.registry import get_pickler
+from fixtures import COMPRESSION_NAMES
 
 
 @pytest.mark.usefixtures("hijack_dill")
@@ -26,25 +33,23 @@ def test_import_error_cloudpickle():
         CloudPicklerIO()
 
 
-@pytest.mark.usefixtures("compressions")
+@pytest.mark.parametrize("compressions", COMPRESSION_NAMES, ids=str)
 def test_pickle_dump_protocol_5(compressions):
     if not (sys.version_info[0] >= 3 and sys.version_info[1] >= 8):
         pytest.skip("Pickle protocol 5 was introduced in version 3.8")
     obj = np.zeros((100, 37000, 3))
-    out = loads(
-        dumps(
-            obj=obj,
-            compression=compressions,
-            pickler_method="pickle",
-            pickler_kwargs={"protocol": 5},
-        ),
+    data = dumps(
+        obj=obj,
         compression=compressions,
         pickler_method="pickle",
+        pickler_kwargs={"protocol": 5},
     )
+    assert type(data) is bytes
+    out = loads(data, compression=compressions, pickler_method="pickle")
     assert np.all(out == obj)
 
 
-@pytest.mark.usefixtures("compressions")
+@pytest.mark.parametrize("compressions", COMPRESSION_NAMES, ids=str)
 def test_json_dump_protocol(compressions):
     obj = {'test_data': list(range(100)), 'fish': False, 'null': None}
     out = loads(
@@ -57,3 +62,99 @@ def test_json_dump_protocol(compressions):
         pickler_method="json",
     )
     assert np.all(out == obj)
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="Pickle protocol 5 requires python 3.8"
+)
+def test_pickle_protocol_5_writes_buffers_to_stream():
+    class Stream(io.BytesIO):
+        def write(self, data):
+            assert not isinstance(data, pickle.PickleBuffer)
+            return super().write(data)
+
+    obj = np.arange(1 << 17)
+    stream = Stream()
+    BuiltinPicklerIO().dump(obj, stream, protocol=5)
+    stream.seek(0)
+    assert np.all(BuiltinPicklerIO().load(stream) == obj)
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="Pickle protocol 5 requires python 3.8"
+)
+def test_pickle_out_of_band_buffers():
+    obj = np.arange(1 << 17)
+    buffers = []
+    stream = io.BytesIO()
+    BuiltinPicklerIO().dump(obj, stream, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert len(stream.getvalue()) < obj.nbytes
+    stream.seek(0)
+    assert np.all(BuiltinPicklerIO().load(stream, buffers=buffers) == obj)
+
+
+@pytest.mark.parametrize(
+    "pickler_method", ["pickle", "optimized_pickle", "cloudpickle", "dill", "marshal"]
+)
+def test_dump_iter(pickler_method):
+    shared = [1, 2, 3]
+    objs = [{"a": shared}, shared, "text", {"b": [shared, shared]}]
+    pickler = get_pickler(pickler_method)()
+    stream = io.BytesIO()
+    pickler.dump_iter(objs, stream)
+    stream.seek(0)
+    assert [pickler.load(stream) for _ in objs] == objs
+    assert stream.read() == b""
+
+
+def test_dill_uses_settings_protocol(monkeypatch):
+    import dill
+
+    monkeypatch.setitem(dill.settings, "protocol", 2)
+    pickler = DillPicklerIO()
+    stream = io.BytesIO()
+    pickler.dump([1, 2], stream)
+    assert stream.getvalue()[:2] == b"\x80\x02"
+    stream = io.BytesIO()
+    pickler.dump_iter([[1, 2]], stream)
+    assert stream.getvalue()[:2] == b"\x80\x02"
+
+
+def test_marshal_dump_kwargs():
+    obj = {"a": [1, 2.5, "b"]}
+    pickler = get_pickler("marshal")()
+    stream = io.BytesIO()
+    pickler.dump(obj, stream, version=2)
+    assert stream.getvalue() == marshal.dumps(obj, 2)
+    with pytest.raises(TypeError, match="unexpected keyword arguments"):
+        pickler.dump(obj, io.BytesIO(), version=2, protocol=3)
+
+
+@pytest.mark.parametrize(
+    "obj", [2.5, 12345678, 10**2000], ids=["float", "int", "bigint"]
+)
+def test_optimized_pickle_skips_single_frame(monkeypatch, obj):
+    data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    assert [op.name for op, _, _ in pickletools.genops(data)].count("FRAME") == 1
+
+    def fail_optimize(data):
+        raise AssertionError("optimize should have been skipped")
+
+    monkeypatch.setattr(pickletools, "optimize", fail_optimize)
+    stream = io.BytesIO()
+    get_pickler("optimized_pickle")().dump(obj, stream)
+    assert stream.getvalue() == data
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [1, 2.5, None, [1, 2], {"a": "b"}, 10**200000],
+    ids=["int", "float", "None", "list", "dict", "framed_int"],
+)
+def test_optimized_pickle_dump(obj):
+    stream = io.BytesIO()
+    get_pickler("optimized_pickle")().dump(obj, stream)
+    assert stream.getvalue() == pickletools.optimize(
+        pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    )
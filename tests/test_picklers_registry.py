@@ -38,6 +38,11 @@ def test_compresser_registry():
         del _pickler_registry._pickler_registry[name]
 
 
+def test_get_pickler_unhashable_name():
+    with pytest.raises(ValueError, match=re.escape("Unknown pickler [1, 2]. ")):
+        get_pickler([1, 2])
+
+
 def test_get_known_picklers():
     assert get_known_picklers() == list(_pickler_registry._pickler_registry)
 
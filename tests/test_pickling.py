@@ -1,13 +1,21 @@
 import os
-import warnings
 import zipfile
+from pathlib import Path
 
 import pytest
 
 from compress_pickle import dump, dumps, load, loads
+from fixtures import (
+    COMPRESSION_NAMES,
+    FILE_COMPRESSIONS,
+    FILENAMES,
+    PAYLOAD_SIZES,
+    PICKLER_NAMES,
+    UNHANDLED_COMPRESSIONS,
+)
 
 
-@pytest.mark.usefixtures("wrong_compressions")
+@pytest.mark.parametrize("wrong_compressions", UNHANDLED_COMPRESSIONS, ids=str)
 def test_dump_fails_on_unhandled_compression(wrong_compressions):
     with pytest.raises(ValueError):
         dump(
@@ -18,7 +26,7 @@ def test_dump_fails_on_unhandled_compression(wrong_compressions):
         )
 
 
-@pytest.mark.usefixtures("wrong_compressions")
+@pytest.mark.parametrize("wrong_compressions", UNHANDLED_COMPRESSIONS, ids=str)
 def test_load_fails_on_unhandled_compression(wrong_compressions):
     with pytest.raises(ValueError):
         load(
@@ -26,6 +34,8 @@ def test_load_fails_on_unhandled_compression(wrong_compressions):
         )
 
 
+@pytest.mark.parametrize("compressions", COMPRESSION_NAMES, ids=str)
+@pytest.mark.parametrize("pickler_method", PICKLER_NAMES, ids=str)
 @pytest.mark.usefixtures("simple_dump_and_remove")
 def test_dump_compresses(simple_dump_and_remove):
     path, compression, pickler_method, message = simple_dump_and_remove
@@ -40,15 +50,18 @@ def test_dump_compresses(simple_dump_and_remove):
         set_default_extension=False,
         **kwargs,
     )
-    with open(path, "rb") as f:
-        compressed_message = f.read()
+    compressed_message = Path(path).read_bytes()
     if compression in (None, "pickle"):
         assert len(compressed_message) > len(message)
     else:
         assert len(compressed_message) < len(message)
 
 
+@pytest.mark.parametrize("file", FILENAMES, ids=str)
+@pytest.mark.parametrize("file_compressions", FILE_COMPRESSIONS, ids=str)
+@pytest.mark.parametrize("set_default_extension", [True, False], ids=str)
 @pytest.mark.usefixtures("dump_load")
+@pytest.mark.filterwarnings("ignore::UserWarning")
 def test_dump_load(dump_load):
     (
         message,
@@ -59,34 +72,36 @@ def test_dump_load(dump_load):
         expected_file,
         expected_fail,
     ) = dump_load
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore", UserWarning)
-        if expected_fail is None:
+    if expected_fail is None:
+        dump(
+            message,
+            path,
+            compression,
+            set_default_extension=set_default_extension,
+        )
+        assert os.path.isfile(expected_file)
+        loaded_message = load(
+            path, compression, set_default_extension=set_default_extension
+        )
+        assert loaded_message == message
+    else:
+        with pytest.raises(expected_fail):
             dump(
                 message,
                 path,
                 compression,
                 set_default_extension=set_default_extension,
             )
-            loaded_message = load(
-                path, compression, set_default_extension=set_default_extension
-            )
-            assert loaded_message == message
-        else:
-            with pytest.raises(expected_fail):
-                dump(
-                    message,
-                    path,
-                    compression,
-                    set_default_extension=set_default_extension,
-                )
-            with pytest.raises(expected_fail):
-                load(path, compression, set_default_extension=set_default_extension)
-
-
-@pytest.mark.usefixtures("random_message", "compressions", "pickler_method")
-def test_dumps_loads(random_message, compressions, pickler_method):
-    message = random_message
+        with pytest.raises(expected_fail):
+            load(path, compression, set_default_extension=set_default_extension)
+
+
+@pytest.mark.parametrize("size", PAYLOAD_SIZES)
+@pytest.mark.parametrize("compressions", COMPRESSION_NAMES, ids=str)
+@pytest.mark.parametrize("pickler_method", PICKLER_NAMES, ids=str)
+@pytest.mark.usefixtures("random_payloads")
+def test_dumps_loads(random_payloads, size, compressions, pickler_method):
+    message = random_payloads[size]
     assert (
         loads(
             dumps(message, compressions, pickler_method=pickler_method),
@@ -97,6 +112,15 @@ def test_dumps_loads(random_message, compressions, pickler_method):
     )
 
 
+def test_dump_keeps_upper_case_extension(tmp_path):
+    path = tmp_path / "DATA.GZ"
+    dump(list(range(10)), path)
+    assert [p.name for p in tmp_path.iterdir()] == ["DATA.GZ"]
+    assert load(path) == list(range(10))
+
+
+@pytest.mark.parametrize("compressions", COMPRESSION_NAMES, ids=str)
+@pytest.mark.parametrize("pickler_method", PICKLER_NAMES, ids=str)
 @pytest.mark.usefixtures("simple_dump_and_remove")
 def test_dump_vs_dumps(simple_dump_and_remove):
     path, compression, pickler_method, message = simple_dump_and_remove
@@ -114,8 +138,7 @@ def test_dump_vs_dumps(simple_dump_and_remove):
     cmp1 = dumps(
         message, compression=compression, pickler_method=pickler_method, **kwargs
     )
-    with open(path, "rb") as f:
-        cmp2 = f.read()
+    cmp2 = Path(path).read_bytes()
     if compression != "gzip":
         assert cmp1 == cmp2
     else:
@@ -124,28 +147,39 @@ def test_dump_vs_dumps(simple_dump_and_remove):
         ) == loads(cmp2, compression, pickler_method=pickler_method, **kwargs)
 
 
+@pytest.mark.parametrize("compressions", COMPRESSION_NAMES, ids=str)
+@pytest.mark.parametrize("pickler_method", PICKLER_NAMES, ids=str)
 @pytest.mark.usefixtures("simple_dump_and_remove")
 def test_dump_load_on_filestreams(simple_dump_and_remove):
     path, compression, pickler_method, message = simple_dump_and_remove
     read_mode = "rb"
     write_mode = "wb"
+    kwargs = {}
+    if compression == "gzip":
+        # gzip stores the modification time in its header, fix it to get reproducible bytes
+        kwargs["mtime"] = 0
     with open(path, write_mode) as f:
-        dump(message, f, compression=compression, pickler_method=pickler_method)
+        dump(
+            message,
+            f,
+            compression=compression,
+            pickler_method=pickler_method,
+            **kwargs,
+        )
     with open(path, read_mode) as f:
         raw_content = f.read()
         f.seek(0)
         loaded_message = load(f, compression=compression, pickler_method=pickler_method)
     assert loaded_message == message
-    os.remove(path)
     dump(
         message,
         path,
         compression=compression,
         pickler_method=pickler_method,
         set_default_extension=False,
+        **kwargs,
     )
-    with open(path, read_mode) as f:
-        benchmark = f.read()
+    benchmark = Path(path).read_bytes()
     # zipfile compression stores the data in a zip archive. The archive then
     # contains a file with the data. Said file's mtime will always be
     # different between the two dump calls, so we skip the follwing assertion
@@ -153,6 +187,8 @@ def test_dump_load_on_filestreams(simple_dump_and_remove):
         assert raw_content == benchmark
 
 
+@pytest.mark.parametrize("compressions", COMPRESSION_NAMES, ids=str)
+@pytest.mark.parametrize("pickler_method", PICKLER_NAMES, ids=str)
 @pytest.mark.usefixtures("simple_dump_and_remove")
 def test_load_vs_loads(simple_dump_and_remove):
     path, compression, pickler_method, message = simple_dump_and_remove
@@ -167,8 +203,7 @@ def test_load_vs_loads(simple_dump_and_remove):
         set_default_extension=False,
         **kwargs,
     )
-    with open(path, "rb") as f:
-        data = f.read()
+    data = Path(path).read_bytes()
     cmp1 = loads(data, compression=compression, pickler_method=pickler_method, **kwargs)
     cmp2 = load(
         path,
@@ -4,16 +4,14 @@ from os.path import splitext
 import numpy as np
 import pytest
 
-from compress_pickle.compressers.registry import (
-    get_compresser_from_extension,
-    get_default_compression_mapping,
-)
+from compress_pickle.compressers.registry import get_compresser_from_extension
 from compress_pickle.utils import (
     _infer_compression_from_path,
     _set_default_extension,
     _stringyfy_path,
     instantiate_compresser,
 )
+from fixtures import COMPRESSION_NAMES, INVALID_EXTENSIONS, VALID_EXTENSIONS
 
 
 def test_stringify_path():
@@ -23,18 +21,33 @@ def test_stringify_path():
         _stringyfy_path({"a"})
 
 
-@pytest.mark.usefixtures("compressions")
-def test_set_default_extension(compressions):
+@pytest.mark.parametrize("compressions", COMPRESSION_NAMES, ids=str)
+@pytest.mark.usefixtures("default_compression_mapping")
+def test_set_default_extension(compressions, default_compression_mapping):
     root = "somepath.someotherstuff"
     path = root + ".ext"
     new_path = _set_default_extension(path, compression=compressions)
     assert splitext(new_path) == (
         root,
-        "." + get_default_compression_mapping()[compressions],
+        "." + default_compression_mapping[compressions],
     )
 
 
-@pytest.mark.usefixtures("valid_extensions")
+@pytest.mark.parametrize(
+    ("path", "compression", "expected"),
+    [
+        ("data.GZ", "gzip", "data.GZ"),
+        ("data.Pkl", None, "data.Pkl"),
+        ("data.LZMA", "lzma", "data.LZMA"),
+        ("data.xz", "lzma", "data.lzma"),
+        ("data.pickle", None, "data.pkl"),
+    ],
+)
+def test_set_default_extension_case_insensitive(path, compression, expected):
+    assert _set_default_extension(path, compression=compression) == expected
+
+
+@pytest.mark.parametrize("valid_extensions", VALID_EXTENSIONS, ids=str)
 def test_infer_compression_from_path(valid_extensions):
     extension, compression = valid_extensions
     path = "some_path." + extension
@@ -45,7 +58,7 @@ def test_infer_compression_from_path(valid_extensions):
         assert compression == inf_compression
 
 
-@pytest.mark.usefixtures("invalid_extensions")
+@pytest.mark.parametrize("invalid_extensions", INVALID_EXTENSIONS, ids=str)
 def test_infer_compression_from_path_unknown(invalid_extensions):
     path = "some_path." + invalid_extensions if invalid_extensions else "some_path"
     with pytest.raises(ValueError):
@@ -70,7 +83,7 @@ def test_instantiate_compresser_cannot_infer_compression():
             instantiate_compresser(compression="infer", path=path, mode="rb")
 
 
-@pytest.mark.usefixtures("valid_extensions")
+@pytest.mark.parametrize("valid_extensions", VALID_EXTENSIONS, ids=str)
 def test_dump_load_context_manager(valid_extensions):
     extension = valid_extensions[0]
     if extension == "zip":